@@ -1,8 +1,55 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session
-from db import get_conn, fetch_all
+from werkzeug.security import check_password_hash, generate_password_hash
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+import hmac
+import secrets
+import threading
+from config import settings
+from db import get_conn, fetch_one, execute
+from ratelimit import TokenBucketLimiter, NegativeCache
 
 bp = Blueprint("auth", __name__)
 
+# -----------------------------
+# Login throttling
+# -----------------------------
+login_limiter = TokenBucketLimiter(settings.LOGIN_RATE_PER_MIN / 60.0, settings.LOGIN_BURST)
+unknown_emails = NegativeCache(settings.LOGIN_NEGATIVE_TTL)
+
+# Hash checks are CPU-bound. The pool caps how many run at once and the
+# semaphore caps how many requests may wait on it; the request thread still
+# blocks on the result, so this bounds concurrency rather than freeing threads.
+hash_pool = ThreadPoolExecutor(max_workers=settings.LOGIN_HASH_WORKERS, thread_name_prefix="pwhash")
+hash_slots = threading.BoundedSemaphore(settings.LOGIN_HASH_QUEUE)
+
+PASSWORD_METHOD = "pbkdf2:sha256:600000"
+# checked on misses so unknown emails cost the same as a wrong password
+DUMMY_HASH = generate_password_hash(secrets.token_hex(16), method=PASSWORD_METHOD)
+
+def is_password_hash(value):
+    return value.startswith(("pbkdf2:", "scrypt:")) and value.count("$") == 2
+
+def run_in_hash_pool(fn, *args):
+    """Run fn in the hash pool; None if the pool is saturated or too slow."""
+    if not hash_slots.acquire(blocking=False):
+        return None
+    fut = hash_pool.submit(fn, *args)
+    fut.add_done_callback(lambda _: hash_slots.release())
+    try:
+        return fut.result(timeout=settings.LOGIN_HASH_TIMEOUT)
+    except FutureTimeout:
+        return None
+
+def verify_password(pw_hash, password):
+    return run_in_hash_pool(check_password_hash, pw_hash, password)
+
+def hash_password(password):
+    return run_in_hash_pool(generate_password_hash, password, PASSWORD_METHOD)
+
+def reject(message="Invalid email or password", category="danger"):
+    flash(message, category)
+    return redirect(url_for("auth.login_form"))
+
 @bp.get("/login")
 def login_form():
     return render_template("login.html")
@@ -11,16 +58,38 @@ def login_form():
 def login_post():
     email = request.form.get("email","").strip()
     password = request.form.get("password","").strip()
-    with get_conn() as conn:
-        rows = fetch_all(conn, """
-            SELECT User_ID, Fname, Lname, Email, Role
-            FROM User
-            WHERE Email = :email AND Password = :password
-        """, {"email": email, "password": password})
-    if not rows:
-        flash("Invalid email or password", "danger")
-        return redirect(url_for("auth.login_form"))
-    user = rows[0]
+    key = email.lower()
+    if not login_limiter.allow(f"ip:{request.remote_addr}") or not login_limiter.allow(f"email:{key}"):
+        return reject("Too many login attempts. Please wait a minute and try again.")
+    if not email:
+        return reject()
+    user = None
+    if key not in unknown_emails:
+        with get_conn() as conn:
+            # Email is UNIQUE, so this is a single index lookup
+            user = fetch_one(conn, """
+                SELECT User_ID, Fname, Lname, Email, Role, Password
+                FROM User
+                WHERE Email = :email
+            """, {"email": email})
+        if not user:
+            unknown_emails.add(key)
+    stored = user["Password"] if user else DUMMY_HASH
+    legacy = not is_password_hash(stored)
+    ok = verify_password(DUMMY_HASH if legacy else stored, password)
+    if ok is None:
+        return reject("Server busy, please try again shortly.", "warning")
+    if legacy:
+        # plaintext row from a database seeded before hashing: verify once, then upgrade it.
+        # If the pool is busy the row stays plaintext and the next login retries.
+        ok = hmac.compare_digest(stored.encode(), password.encode())
+        new_hash = hash_password(password) if ok else None
+        if new_hash:
+            with get_conn() as conn:
+                execute(conn, "UPDATE User SET Password = :pw WHERE User_ID = :uid",
+                        {"pw": new_hash, "uid": user["User_ID"]})
+    if not ok or not user:
+        return reject()
     session["user_id"] = user["User_ID"]
     session["user_name"] = f"{user['Fname']} {user['Lname']}"
     session["role"] = user["Role"]
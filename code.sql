@@ -294,12 +294,13 @@ WHERE a.Price = (
 -- =========================================================
 -- SAMPLE DATA
 -- =========================================================
+-- Passwords are werkzeug pbkdf2 hashes of the old demo passwords (alice123, bob123, ...)
 INSERT INTO User (Fname, Lname, Email, Password, Role, Contact_No, Address, Bio) VALUES
-('Alice','Painter','alice@vm.com','alice123','Artist','+911234567890','Mumbai, India','Contemporary artist'),
-('Bob','Sculptor','bob@vm.com','bob123','Artist','+911234567891','Delhi, India','Bronze sculptor'),
-('Charlie','Viewer','charlie@vm.com','charlie123','Customer','+911234567892','Kolkata, India','Likes digital art'),
-('Diana','Collector','diana@vm.com','diana123','Customer','+911234567893','Chennai, India','Collector'),
-('Admin','One','admin@vm.com','admin123','Admin','+919999999999','Hyderabad, India','Sys admin');
+('Alice','Painter','alice@vm.com','pbkdf2:sha256:600000$1JbxNZGeiryqGwEz$ce1b9d239c63c139e64f559e00e158f3dec1e5d3e295d9e10e6eb1350be47e40','Artist','+911234567890','Mumbai, India','Contemporary artist'),
+('Bob','Sculptor','bob@vm.com','pbkdf2:sha256:600000$BObWcutRY2vjOyQG$db211cb85f76ec64230a661c3be966b83bb9431185e155d23355f25ffb448370','Artist','+911234567891','Delhi, India','Bronze sculptor'),
+('Charlie','Viewer','charlie@vm.com','pbkdf2:sha256:600000$xLEDGe1Obgmr9QSJ$2d77ad1d232c7562791125af6589293e3d66ef778674684a13fe1bed4b5ce10c','Customer','+911234567892','Kolkata, India','Likes digital art'),
+('Diana','Collector','diana@vm.com','pbkdf2:sha256:600000$9gjSApTsbYzQaY4z$e75056de9c8602d7ca3a497c8bc899c53a6edb8f8d23fa6998082a5abf26ed13','Customer','+911234567893','Chennai, India','Collector'),
+('Admin','One','admin@vm.com','pbkdf2:sha256:600000$aAhJBHFDdpv0QSZS$f93526985bc937d6237810d3b21285f815bc433c2cc6e88ce42e8a15dd491f79','Admin','+919999999999','Hyderabad, India','Sys admin');
 
 INSERT INTO Museum (Name, Location, Capacity) VALUES
 ('National Art House','Mumbai, India',500),
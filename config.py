@@ -20,4 +20,12 @@ class Settings:
     MAX_CONTENT_LENGTH = 8 * 1024 * 1024  # 8 MB
     ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "webp"}
 
+    # login throttling / hashing
+    LOGIN_RATE_PER_MIN = float(os.getenv("LOGIN_RATE_PER_MIN", "10"))
+    LOGIN_BURST = int(os.getenv("LOGIN_BURST", "5"))
+    LOGIN_HASH_WORKERS = int(os.getenv("LOGIN_HASH_WORKERS", "4"))
+    LOGIN_HASH_QUEUE = int(os.getenv("LOGIN_HASH_QUEUE", str(2 * LOGIN_HASH_WORKERS)))
+    LOGIN_HASH_TIMEOUT = float(os.getenv("LOGIN_HASH_TIMEOUT", "5"))  # seconds
+    LOGIN_NEGATIVE_TTL = int(os.getenv("LOGIN_NEGATIVE_TTL", "300"))  # seconds
+
 settings = Settings()
@@ -0,0 +1 @@
+# Lets pytest put the repo root on sys.path so tests can import app modules directly.
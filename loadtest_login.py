@@ -0,0 +1,81 @@
+"""Credential-stuffing burst against /login; reports DB queries per request.
+
+Runs against the MySQL database from code.sql, or with --sqlite against a
+throwaway SQLite file holding only the User rows from code.sql. Usage:
+    python loadtest_login.py [--sqlite] [--requests N] [--threads N] [--ips N] [--emails N]
+"""
+import argparse
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import create_engine, event, text
+import db
+
+def sqlite_engine():
+    """SQLite copy of the User table seeded from code.sql."""
+    path = os.path.join(tempfile.mkdtemp(), "loadtest.db")
+    eng = create_engine(f"sqlite:///{path}")
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "code.sql")) as f:
+        rows = re.search(r"INSERT INTO User \((.*?)\) VALUES\n(.*?);", f.read(), re.S)
+    with eng.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE User (User_ID INTEGER PRIMARY KEY, Fname TEXT, Lname TEXT, Email TEXT UNIQUE,
+                               Password TEXT, Role TEXT, Contact_No TEXT, Address TEXT, Bio TEXT)
+        """))
+        conn.execute(text(f"INSERT INTO User ({rows.group(1)}) VALUES {rows.group(2)}"))
+    return eng
+
+def run(n_requests, n_threads, n_ips, n_emails):
+    from app import app
+    lock = threading.Lock()
+    counts = {"queries": 0, "rejected": 0, "busy": 0}
+
+    def count_query(*_):
+        with lock:
+            counts["queries"] += 1
+
+    for eng in {db.engine_default, db.engine_read, db.engine_admin}:
+        event.listen(eng, "before_cursor_execute", count_query)
+
+    emails = ["alice@vm.com"] + [f"victim{i}@example.com" for i in range(n_emails - 1)]
+
+    def attacker(worker):
+        client = app.test_client()
+        for i in range(worker, n_requests, n_threads):
+            client.post(
+                "/login",
+                data={"email": emails[i % n_emails], "password": f"guess{i}"},
+                environ_base={"REMOTE_ADDR": f"10.0.0.{i % n_ips}"},
+            )
+            with client.session_transaction() as sess:
+                flashes = sess.pop("_flashes", [])
+            with lock:
+                counts["rejected"] += any("Too many" in msg for _, msg in flashes)
+                counts["busy"] += any("Server busy" in msg for _, msg in flashes)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        list(pool.map(attacker, range(n_threads)))
+    elapsed = time.perf_counter() - start
+    queries = counts["queries"]
+    print(f"requests:      {n_requests} from {n_threads} threads in {elapsed:.2f}s")
+    print(f"rate-limited:  {counts['rejected']} ({counts['rejected'] / n_requests:.0%})")
+    print(f"server busy:   {counts['busy']}")
+    print(f"db queries:    {queries} ({queries / n_requests:.3f} per request)")
+    # wall-clock rate; after hashing it is bounded by hash latency, not by the DB
+    print(f"db q/s:        {queries / elapsed:.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sqlite", action="store_true", help="use a SQLite copy of the User table instead of MySQL")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=50)
+    parser.add_argument("--ips", type=int, default=20)
+    parser.add_argument("--emails", type=int, default=200)
+    args = parser.parse_args()
+    if args.sqlite:
+        db.engine_default = db.engine_read = db.engine_admin = sqlite_engine()
+    run(args.requests, args.threads, args.ips, args.emails)
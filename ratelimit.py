@@ -0,0 +1,73 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenBucketLimiter:
+    """In-memory token buckets keyed by an arbitrary string (IP, email, ...).
+
+    At most `max_keys` buckets are kept; the least recently used one is
+    dropped first, so memory and per-call cost stay bounded under a flood.
+    """
+
+    def __init__(self, rate_per_sec, burst, max_keys=10000):
+        self.rate = rate_per_sec
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # key -> (tokens, last_refill), LRU order
+        self._lock = threading.Lock()
+
+    def allow(self, key):
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.pop(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class NegativeCache:
+    """Remembers keys that recently missed, for `ttl` seconds.
+
+    Entries are kept in insertion order, which is also expiry order since the
+    ttl is fixed, so expired ones are trimmed from the front.
+    """
+
+    def __init__(self, ttl, max_keys=10000):
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self._expiry = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        now = time.monotonic()
+        with self._lock:
+            exp = self._expiry.get(key)
+            if exp is None:
+                return False
+            if exp <= now:
+                del self._expiry[key]
+                return False
+            return True
+
+    def __len__(self):
+        return len(self._expiry)
+
+    def add(self, key):
+        now = time.monotonic()
+        with self._lock:
+            self._expiry.pop(key, None)
+            self._expiry[key] = now + self.ttl
+            while self._expiry:
+                oldest, exp = next(iter(self._expiry.items()))
+                if exp > now and len(self._expiry) <= self.max_keys:
+                    break
+                del self._expiry[oldest]
@@ -0,0 +1,123 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.pool import StaticPool
+from werkzeug.security import generate_password_hash
+
+import auth
+import db
+from app import app
+from ratelimit import TokenBucketLimiter, NegativeCache
+
+FAST_METHOD = "pbkdf2:sha256:1000"
+
+
+@pytest.fixture
+def users(monkeypatch):
+    eng = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    with eng.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE User (User_ID INTEGER PRIMARY KEY, Fname TEXT, Lname TEXT,
+                               Email TEXT UNIQUE, Password TEXT, Role TEXT)
+        """))
+        conn.execute(text("""
+            INSERT INTO User (Fname, Lname, Email, Password, Role) VALUES
+            ('Alice', 'Painter', 'alice@vm.com', :hashed, 'Artist'),
+            ('Admin', 'One', 'admin@vm.com', 'admin123', 'Admin')
+        """), {"hashed": generate_password_hash("alice123", FAST_METHOD)})
+    for name in ("engine_default", "engine_read", "engine_admin"):
+        monkeypatch.setattr(db, name, eng)
+    # cheap hashes and fresh limiter/cache state for every test
+    monkeypatch.setattr(auth, "PASSWORD_METHOD", FAST_METHOD)
+    monkeypatch.setattr(auth, "DUMMY_HASH", generate_password_hash("x", FAST_METHOD))
+    monkeypatch.setattr(auth, "login_limiter", TokenBucketLimiter(1 / 60.0, 3))
+    monkeypatch.setattr(auth, "unknown_emails", NegativeCache(300))
+    eng.selects = []
+
+    @event.listens_for(eng, "before_cursor_execute")
+    def record_select(conn, cursor, statement, *args):
+        if statement.lstrip().startswith("SELECT"):
+            eng.selects.append(statement)
+
+    return eng
+
+
+def password_of(eng, email):
+    with eng.connect() as conn:
+        return conn.execute(text("SELECT Password FROM User WHERE Email = :e"), {"e": email}).scalar()
+
+
+def login(email, password, ip="10.0.0.1"):
+    client = app.test_client()
+    resp = client.post("/login", data={"email": email, "password": password}, environ_base={"REMOTE_ADDR": ip})
+    with client.session_transaction() as sess:
+        messages = [msg for _, msg in sess.get("_flashes", [])]
+        user_id = sess.get("user_id")
+    return resp.location, messages, user_id
+
+
+def test_hashed_user_logs_in(users):
+    location, messages, user_id = login("alice@vm.com", "alice123")
+    assert location == "/dashboard"
+    assert user_id == 1
+    assert messages == ["Welcome, Alice Painter!"]
+
+
+def test_hashed_user_wrong_password(users):
+    location, messages, user_id = login("alice@vm.com", "nope")
+    assert location == "/login"
+    assert user_id is None
+    assert messages == ["Invalid email or password"]
+
+
+def test_plaintext_row_is_rehashed_on_first_login(users):
+    location, _, user_id = login("admin@vm.com", "admin123")
+    assert location == "/dashboard" and user_id == 2
+    stored = password_of(users, "admin@vm.com")
+    assert stored.startswith("pbkdf2:sha256:")
+    location, _, _ = login("admin@vm.com", "admin123", ip="10.0.0.2")
+    assert location == "/dashboard"
+
+
+def test_plaintext_row_wrong_password_is_rejected(users):
+    location, messages, _ = login("admin@vm.com", "wrong")
+    assert location == "/login"
+    assert messages == ["Invalid email or password"]
+    assert password_of(users, "admin@vm.com") == "admin123"
+
+
+def test_plaintext_row_not_upgraded_when_pool_busy(users, monkeypatch):
+    monkeypatch.setattr(auth, "hash_password", lambda password: None)
+    location, _, _ = login("admin@vm.com", "admin123")
+    assert location == "/dashboard"
+    assert password_of(users, "admin@vm.com") == "admin123"
+
+
+def test_unknown_email_is_cached(users):
+    assert login("ghost@vm.com", "x")[1] == ["Invalid email or password"]
+    assert len(users.selects) == 1
+    assert login("ghost@vm.com", "x", ip="10.0.0.2")[1] == ["Invalid email or password"]
+    assert len(users.selects) == 1
+
+
+def test_too_many_attempts_from_one_ip(users):
+    for i in range(3):
+        login(f"user{i}@vm.com", "x")
+    location, messages, _ = login("alice@vm.com", "alice123")
+    assert location == "/login"
+    assert messages == ["Too many login attempts. Please wait a minute and try again."]
+
+
+def test_too_many_attempts_for_one_email(users):
+    for i in range(3):
+        login("alice@vm.com", "x", ip=f"10.0.1.{i}")
+    _, messages, user_id = login("alice@vm.com", "alice123", ip="10.0.2.1")
+    assert messages == ["Too many login attempts. Please wait a minute and try again."]
+    assert user_id is None
+
+
+def test_saturated_pool_reports_busy(users, monkeypatch):
+    monkeypatch.setattr(auth, "verify_password", lambda pw_hash, password: None)
+    location, messages, user_id = login("alice@vm.com", "alice123")
+    assert location == "/login"
+    assert messages == ["Server busy, please try again shortly."]
+    assert user_id is None
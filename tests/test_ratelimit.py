@@ -0,0 +1,71 @@
+import pytest
+
+import ratelimit
+from ratelimit import TokenBucketLimiter, NegativeCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_bucket_allows_burst_then_rejects(clock):
+    limiter = TokenBucketLimiter(rate_per_sec=1, burst=3)
+    assert [limiter.allow("ip:1") for _ in range(4)] == [True, True, True, False]
+
+
+def test_bucket_refills_over_time(clock):
+    limiter = TokenBucketLimiter(rate_per_sec=0.5, burst=2)
+    assert limiter.allow("k") and limiter.allow("k")
+    assert not limiter.allow("k")
+    clock[0] += 1
+    assert not limiter.allow("k")
+    clock[0] += 1
+    assert limiter.allow("k")
+    clock[0] += 100
+    assert [limiter.allow("k") for _ in range(3)] == [True, True, False]
+
+
+def test_buckets_are_per_key(clock):
+    limiter = TokenBucketLimiter(rate_per_sec=1, burst=1)
+    assert limiter.allow("a")
+    assert not limiter.allow("a")
+    assert limiter.allow("b")
+
+
+def test_bucket_map_is_capped_lru(clock):
+    limiter = TokenBucketLimiter(rate_per_sec=1, burst=1, max_keys=3)
+    for key in ("a", "b", "c"):
+        limiter.allow(key)
+    limiter.allow("a")  # touch "a" so "b" is least recently used
+    limiter.allow("d")
+    assert len(limiter) == 3
+    assert not limiter.allow("a")  # still tracked, still empty
+    assert limiter.allow("b")  # evicted, so it starts with a full bucket
+
+
+def test_negative_cache_expires(clock):
+    cache = NegativeCache(ttl=10)
+    cache.add("x@vm.com")
+    assert "x@vm.com" in cache
+    assert "y@vm.com" not in cache
+    clock[0] += 10
+    assert "x@vm.com" not in cache
+
+
+def test_negative_cache_drops_expired_and_caps_size(clock):
+    cache = NegativeCache(ttl=10, max_keys=3)
+    cache.add("a")
+    cache.add("b")
+    clock[0] += 5
+    cache.add("c")
+    cache.add("d")  # over the cap: oldest ("a") goes
+    assert len(cache) == 3
+    assert "a" not in cache and "d" in cache
+    clock[0] += 6  # "b" expired, "c"/"d" still live
+    cache.add("e")
+    assert len(cache) == 3
+    assert "b" not in cache
+    assert all(k in cache for k in "cde")